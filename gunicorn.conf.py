@@ -2,15 +2,19 @@
 Gunicorn configuration for production deployment.
 """
 
+import logging
 import multiprocessing
 import os
 
+# Configured once in the master; workers inherit it when they are forked
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
 # Server socket
 bind = "0.0.0.0:5000"
 backlog = 2048
 
 # Worker processes
-workers = int(os.getenv("WORKERS", multiprocessing.cpu_count() * 2 + 1))
+workers = int(os.getenv("WORKERS", multiprocessing.cpu_count() + 1))
 worker_class = os.getenv("WORKER_CLASS", "uvicorn.workers.UvicornWorker")
 worker_connections = 1000
 max_requests = int(os.getenv("MAX_REQUESTS", 1000))
@@ -18,14 +22,13 @@ max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 100))
 timeout = int(os.getenv("TIMEOUT", 300))
 keepalive = 2
 
-# Restart workers after this many seconds
-max_worker_age = 3600
-
 # Logging
 accesslog = "/app/logs/access.log"
 errorlog = "/app/logs/error.log"
 loglevel = os.getenv("LOG_LEVEL", "info")
 access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" %(D)s'
+# Seconds a worker may hold access log lines in memory before writing them out
+access_log_flush_interval = float(os.getenv("ACCESS_LOG_FLUSH_INTERVAL", 1.0))
 
 # Process naming
 proc_name = "noteparser"
@@ -46,6 +49,9 @@ graceful_timeout = 30
 statsd_host = os.getenv("STATSD_HOST")
 if statsd_host:
     statsd_prefix = "noteparser"
+    logger_class = "noteparser.web.gunicorn_logging.StatsdAccessLogger"
+else:
+    logger_class = "noteparser.web.gunicorn_logging.AccessLogger"
 
 
 # Worker process hooks
@@ -87,28 +93,29 @@ def when_ready(server):
 def worker_abort(worker):
     """Called when a worker receives the SIGABRT signal."""
     worker.log.info(f"Worker {worker.pid} aborted")
+    worker.log.stop_access_log_writer()
+
+
+def worker_exit(server, worker):
+    """Called just after a worker has been exited, in the worker process."""
+    worker.log.stop_access_log_writer()
 
 
 # Application-specific settings
 def post_worker_init(worker):
     """Called just after a worker has initialized the application."""
-    from noteparser.web.app import create_app
-
-    # Initialize application-specific resources
-    app = create_app()
-
-    # Setup logging for the worker
-    import logging
+    # The app is built once in the master (preload_app) and shared copy-on-write
+    # with the workers, so only per-worker logging is set up here
 
-    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+    # Write access log lines in batches from a background thread, not per request
+    worker.log.start_access_log_writer(access_log_flush_interval)
 
-    worker.log.info(f"Worker {worker.pid} initialized with AI services")
+    worker.log.info(f"Worker {worker.pid} initialized")
 
 
 # Environment-specific configurations
 if os.getenv("NOTEPARSER_ENV") == "production":
     # Production-specific settings
-    workers = max(2, multiprocessing.cpu_count())
     worker_class = "uvicorn.workers.UvicornWorker"
     preload_app = True
 
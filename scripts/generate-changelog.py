@@ -5,11 +5,26 @@ Generates changelog entries from git commits with conventional commit format.
 """
 
 import argparse
+import contextlib
+import io
 import re
 import subprocess
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# (hash, subject, author, date) as reported by git log
+Commit = tuple[str, str, str, str]
+
+# Commits reachable from any tag, and the parent hashes of each commit
+TaggedHistory = tuple[list[Commit], dict[str, list[str]]]
+
+# git fields are separated by ASCII RS (%x1e) and git log records end with
+# ASCII US (%x1f); neither can appear in a ref name, commit subject or author
+FIELD_SEPARATOR = "\x1e"
+RECORD_TERMINATOR = "\x1f\n"
+
 
 class ChangelogGenerator:
     """Generate changelog from git commits using conventional commit format."""
@@ -28,26 +43,177 @@ class ChangelogGenerator:
         "revert": "### ⏪ Reverts",
     }
 
+    # Conventional commit format: type(scope): description
+    COMMIT_PATTERN = re.compile(r"^(\w+)(?:\(([^)]+)\))?(!)?: (.+)$")
+
     def __init__(self, repo_path: Path = None):
         self.repo_path = repo_path or Path.cwd()
         self.changelog_path = self.repo_path / "CHANGELOG.md"
+        self._tag_dates: dict[str, str] = {}
+        self._tag_commits: dict[str, str] = {}
+
+    def _ensure_commit_graph(self) -> None:
+        """Best-effort commit-graph write, so full-history walks stay fast, if the repo has none."""
+        try:
+            result = subprocess.run(
+                [
+                    "git",
+                    "rev-parse",
+                    "--git-path",
+                    "objects/info/commit-graph",
+                    "--git-path",
+                    "objects/info/commit-graphs/commit-graph-chain",
+                ],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            return
+        if any((self.repo_path / path).exists() for path in result.stdout.splitlines()):
+            return
+
+        with contextlib.suppress(OSError):
+            subprocess.run(
+                ["git", "commit-graph", "write", "--reachable"],
+                cwd=self.repo_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
 
     def get_git_tags(self) -> list[str]:
-        """Get all git tags sorted by version."""
+        """Get all git tags sorted by version, caching the commit and date of each tag."""
         try:
+            # %(*...) is only set for annotated tags (the peeled commit), the
+            # unstarred commit fields only for lightweight tags. for-each-ref
+            # spells the RS separator %1e rather than git log's %x1e.
             result = subprocess.run(
-                ["git", "tag", "--sort=-version:refname"],
+                [
+                    "git",
+                    "for-each-ref",
+                    "--sort=-version:refname",
+                    "--format=%(refname:lstrip=2)%1e%(objectname)%1e%(*objectname)"
+                    "%1e%(authordate:short)%1e%(*authordate:short)",
+                    "refs/tags",
+                ],
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
                 check=True,
             )
-            return [tag.strip() for tag in result.stdout.split("\n") if tag.strip()]
         except subprocess.CalledProcessError:
             return []
 
-    def get_commits_between_tags(self, from_tag: str | None, to_tag: str | None) -> list[str]:
-        """Get commits between two tags."""
+        tags = []
+        # Not splitlines(): it would also break lines at the RS separators
+        for line in result.stdout.split("\n"):
+            if not line:
+                continue
+            tag, object_name, peeled_name, date, peeled_date = line.split(FIELD_SEPARATOR, 4)
+            tags.append(tag)
+            self._tag_commits[tag] = peeled_name or object_name
+            self._tag_dates[tag] = peeled_date or date
+        return tags
+
+    def _iter_git_log(self, args: list[str], fields: int) -> Iterator[list[str]]:
+        """
+        Stream ``git log`` records without buffering the whole output.
+        Raises CalledProcessError once the stream is exhausted if git failed.
+        """
+        # Only subjects are needed: skip diff generation and rename detection
+        proc = subprocess.Popen(
+            ["git", "log", "-s", "--no-renames", *args],
+            cwd=self.repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        pending = ""
+        try:
+            # Split whole chunks at once rather than iterating line by line
+            while chunk := proc.stdout.read(65536):
+                records = (pending + chunk).split(RECORD_TERMINATOR)
+                pending = records.pop()
+                for record in records:
+                    parts = record.split(FIELD_SEPARATOR, fields - 1)
+                    if len(parts) == fields:
+                        yield parts
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, proc.args)
+
+    def get_tagged_history(self) -> TaggedHistory:
+        """Read every commit reachable from a tag, with its parents, in one ``git log`` pass."""
+        commits: list[Commit] = []
+        parents: dict[str, list[str]] = {}
+
+        try:
+            for commit_hash, parent_hashes, message, author, date in self._iter_git_log(
+                [
+                    "--no-decorate",
+                    "--pretty=tformat:%H%x1e%P%x1e%s%x1e%an%x1e%ad%x1f",
+                    "--date=short",
+                    "--tags",
+                ],
+                fields=5,
+            ):
+                commits.append((commit_hash, message, author, date))
+                parents[commit_hash] = parent_hashes.split()
+        except subprocess.CalledProcessError:
+            return [], {}
+
+        return commits, parents
+
+    def get_commits_by_tag(
+        self,
+        tags: list[str],
+        history: TaggedHistory | None = None,
+    ) -> dict[str, list[Commit]]:
+        """
+        Get the commits introduced by each tag.
+
+        Each commit belongs to the oldest tag it is reachable from, which is
+        what ``previous_tag..tag`` gives as long as every release contains the
+        releases before it, merges included.
+        """
+        if not tags:
+            return {}
+        if history is None:
+            history = self.get_tagged_history()
+        commits, parents = history
+
+        # Walk back from each tag, oldest version first, stopping at commits an
+        # older tag already claimed. Several tags on one commit: the lowest
+        # version owns the commits, the others end up with an empty range.
+        owners: dict[str, str] = {}
+        for tag in reversed(tags):
+            pending = [self._tag_commits[tag]] if tag in self._tag_commits else []
+            while pending:
+                commit_hash = pending.pop()
+                if commit_hash in owners or commit_hash not in parents:
+                    continue
+                owners[commit_hash] = tag
+                pending.extend(parents[commit_hash])
+
+        buckets: dict[str, list[Commit]] = {}
+        for commit in commits:
+            tag = owners.get(commit[0])
+            if tag is not None:
+                buckets.setdefault(tag, []).append(commit)
+
+        return buckets
+
+    def iter_commits_between_tags(
+        self,
+        from_tag: str | None,
+        to_tag: str | None,
+    ) -> Iterator[Commit]:
+        """Iterate over the commits between two tags as they are read from git."""
         if from_tag and to_tag:
             rev_range = f"{from_tag}..{to_tag}"
         elif from_tag:
@@ -57,26 +223,25 @@ class ChangelogGenerator:
         else:
             rev_range = "HEAD"
 
-        try:
-            result = subprocess.run(
-                ["git", "log", "--pretty=format:%H|%s|%an|%ad", "--date=short", rev_range],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True,
+        yield from (
+            tuple(parts)
+            for parts in self._iter_git_log(
+                [
+                    "--no-decorate",
+                    "--pretty=tformat:%H%x1e%s%x1e%an%x1e%ad%x1f",
+                    "--date=short",
+                    rev_range,
+                ],
+                fields=4,
             )
-            return [line.strip() for line in result.stdout.split("\n") if line.strip()]
-        except subprocess.CalledProcessError:
-            return []
+        )
 
     def parse_conventional_commit(self, commit_message: str) -> tuple[str, str, str, bool]:
         """
         Parse conventional commit message.
         Returns: (type, scope, description, is_breaking)
         """
-        # Conventional commit format: type(scope): description
-        pattern = r"^(\w+)(?:\(([^)]+)\))?(!)?: (.+)$"
-        match = re.match(pattern, commit_message)
+        match = self.COMMIT_PATTERN.match(commit_message)
 
         if match:
             commit_type = match.group(1)
@@ -88,17 +253,12 @@ class ChangelogGenerator:
         # Fallback for non-conventional commits
         return "chore", "", commit_message, False
 
-    def group_commits_by_type(self, commits: list[str]) -> dict[str, list[dict]]:
-        """Group commits by their type."""
+    def group_commits_by_type(self, commits: Iterable[Commit]) -> dict[str, list[dict]]:
+        """Group commits by their type, consuming them one at a time."""
         grouped = {}
         breaking_changes = []
 
-        for commit_line in commits:
-            parts = commit_line.split("|", 3)
-            if len(parts) < 4:
-                continue
-
-            commit_hash, message, author, date = parts
+        for commit_hash, message, author, date in commits:
             commit_type, scope, description, is_breaking = self.parse_conventional_commit(message)
 
             commit_info = {
@@ -124,13 +284,28 @@ class ChangelogGenerator:
 
     def generate_version_entry(self, version: str, from_tag: str | None) -> str:
         """Generate changelog entry for a specific version."""
-        commits = self.get_commits_between_tags(from_tag, version)
-        if not commits:
+        try:
+            grouped_commits = self.group_commits_by_type(
+                self.iter_commits_between_tags(from_tag, version),
+            )
+        except subprocess.CalledProcessError:
             return ""
 
-        grouped_commits = self.group_commits_by_type(commits)
+        if not grouped_commits:
+            return ""
+
+        return self.format_version_entry(
+            version,
+            self.get_version_date(version),
+            grouped_commits,
+            from_tag,
+        )
+
+    def get_version_date(self, version: str) -> str:
+        """Get the date of a version, preferring dates cached by get_git_tags."""
+        if version in self._tag_dates:
+            return self._tag_dates[version]
 
-        # Get version date
         try:
             result = subprocess.run(
                 ["git", "log", "-1", "--format=%ad", "--date=short", version],
@@ -139,28 +314,31 @@ class ChangelogGenerator:
                 text=True,
                 check=True,
             )
-            version_date = result.stdout.strip()
+            return result.stdout.strip()
         except subprocess.CalledProcessError:
-            version_date = datetime.now().strftime("%Y-%m-%d")
+            return datetime.now().strftime("%Y-%m-%d")
+
+    def format_version_entry(
+        self,
+        version: str,
+        version_date: str,
+        grouped_commits: dict[str, list[dict]],
+        from_tag: str | None,
+    ) -> str:
+        """Render the changelog entry for a version from its grouped commits."""
+        buf = io.StringIO()
+        write = buf.write
 
         # Build changelog entry
-        lines = [
-            f"## [{version}] - {version_date}",
-            "",
-        ]
+        write(f"## [{version}] - {version_date}\n\n")
 
         # Breaking changes first
         if "BREAKING" in grouped_commits:
-            lines.extend(
-                [
-                    "### 💥 BREAKING CHANGES",
-                    "",
-                ],
-            )
+            write("### 💥 BREAKING CHANGES\n\n")
             for commit in grouped_commits["BREAKING"]:
                 scope_str = f"**{commit['scope']}**: " if commit["scope"] else ""
-                lines.append(f"- {scope_str}{commit['message']} ([{commit['hash']}])")
-            lines.append("")
+                write(f"- {scope_str}{commit['message']} ([{commit['hash']}])\n")
+            write("\n")
 
         # Other changes grouped by type
         for commit_type in [
@@ -177,29 +355,24 @@ class ChangelogGenerator:
         ]:
             if commit_type in grouped_commits and commit_type != "BREAKING":
                 type_header = self.COMMIT_TYPES.get(commit_type, f"### {commit_type.title()}")
-                lines.extend(
-                    [
-                        type_header,
-                        "",
-                    ],
-                )
+                write(f"{type_header}\n\n")
 
                 for commit in grouped_commits[commit_type]:
                     scope_str = f"**{commit['scope']}**: " if commit["scope"] else ""
-                    lines.append(f"- {scope_str}{commit['message']} ([{commit['hash']}])")
-                lines.append("")
+                    write(f"- {scope_str}{commit['message']} ([{commit['hash']}])\n")
+                write("\n")
 
         # Add comparison link
         if from_tag:
-            lines.append(
+            write(
                 f"[{version}]: https://github.com/CollegeNotesOrg/noteparser/compare/{from_tag}...{version}",
             )
         else:
-            lines.append(
+            write(
                 f"[{version}]: https://github.com/CollegeNotesOrg/noteparser/releases/tag/{version}",
             )
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def update_changelog_for_version(self, version: str) -> None:
         """Update CHANGELOG.md with a new version entry."""
@@ -233,32 +406,31 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 
 """
 
-        # Insert new entry after header
-        lines = content.split("\n")
-        header_end = 0
-        for i, line in enumerate(lines):
-            if line.startswith("##"):
-                header_end = i
-                break
-
-        if header_end == 0:
-            # No existing versions, add after header
-            for i, line in enumerate(lines):
-                if line.strip() == "":
-                    header_end = i + 1
-                    break
-
-        # Insert new entry
-        lines.insert(header_end, new_entry)
-        lines.insert(header_end + 1, "")
+        # Insert new entry before the latest version
+        match = re.search(r"^##", content, re.MULTILINE)
+        if match and match.start() > 0:
+            insert_at = match.start()
+        else:
+            # No existing versions, add after the first blank line of the header
+            blank = re.search(r"^[^\S\n]*\n", content, re.MULTILINE)
+            insert_at = blank.end() if blank else 0
 
         # Write back to file
-        self.changelog_path.write_text("\n".join(lines))
+        self.changelog_path.write_text(
+            content[:insert_at] + new_entry + "\n\n" + content[insert_at:],
+        )
         print(f"✅ Updated CHANGELOG.md for version {version}")
 
     def generate_full_changelog(self) -> None:
         """Generate complete changelog from all git tags."""
-        tags = self.get_git_tags()
+        self._ensure_commit_graph()
+
+        # Listing the tags and walking the history are independent git processes
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tags_future = executor.submit(self.get_git_tags)
+            history_future = executor.submit(self.get_tagged_history)
+            tags = tags_future.result()
+            commits_by_tag = self.get_commits_by_tag(tags, history_future.result())
 
         header = """# Changelog
 
@@ -271,10 +443,18 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
 
         entries = []
         for i, tag in enumerate(tags):
+            commits = commits_by_tag.get(tag)
+            if not commits:
+                continue
             from_tag = tags[i + 1] if i + 1 < len(tags) else None
-            entry = self.generate_version_entry(tag, from_tag)
-            if entry:
-                entries.append(entry)
+            entries.append(
+                self.format_version_entry(
+                    tag,
+                    self.get_version_date(tag),
+                    self.group_commits_by_type(commits),
+                    from_tag,
+                ),
+            )
 
         full_changelog = header + "\n\n".join(entries)
         self.changelog_path.write_text(full_changelog)
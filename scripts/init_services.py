@@ -7,6 +7,8 @@ initial data for the AI-enhanced noteparser system.
 """
 
 import asyncio
+import copy
+import functools
 import logging
 import os
 import sys
@@ -15,10 +17,7 @@ from typing import Any
 
 import yaml
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
-
-from src.noteparser.integration.ai_services import AIServicesIntegration
+from noteparser.integration.ai_services import AIServicesIntegration
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +26,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for each database before reporting it unreachable
+CONNECT_TIMEOUT = 3
+
+# Use the libyaml C loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_file(config_path: Path) -> dict[str, Any]:
+    """Parse a services.yml file once per process."""
+    with open(config_path) as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
 
 class ServiceInitializer:
     """Initialize and configure all AI services."""
@@ -34,14 +46,16 @@ class ServiceInitializer:
     def __init__(self):
         self.config = self.load_config()
         self.services = {}
+        self._engine = None
+        self._es = None
 
     def load_config(self) -> dict[str, Any]:
         """Load configuration from file or environment."""
         config_path = Path(__file__).parent.parent / "config" / "services.yml"
 
         if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
+            # Copy so callers can't modify the memoized parse
+            config = copy.deepcopy(_load_config_file(config_path))
         else:
             # Default configuration
             config = {
@@ -89,28 +103,65 @@ class ServiceInitializer:
 
         return config
 
+    def _db_engine(self):
+        """Get the shared SQLAlchemy engine, creating it on first use."""
+        if self._engine is None:
+            from sqlalchemy import create_engine
+
+            db_config = self.config["database"]["postgres"]
+            db_url = (
+                f"postgresql://{db_config['user']}:{db_config['password']}@"
+                f"{db_config['host']}:{db_config['port']}/{db_config['database']}"
+            )
+            self._engine = create_engine(
+                db_url,
+                pool_pre_ping=True,
+                pool_size=1,
+                connect_args={"connect_timeout": CONNECT_TIMEOUT},
+            )
+        return self._engine
+
+    def _es_client(self):
+        """Get the shared Elasticsearch client, creating it on first use."""
+        if self._es is None:
+            from elasticsearch import Elasticsearch
+
+            self._es = Elasticsearch(
+                [
+                    f"{self.config['database']['elasticsearch']['host']}:"
+                    f"{self.config['database']['elasticsearch']['port']}",
+                ],
+                request_timeout=5,
+                max_retries=1,
+            )
+        return self._es
+
     async def check_database_connections(self) -> bool:
         """Check if databases are accessible."""
         logger.info("Checking database connections...")
 
-        # Check PostgreSQL
+        # Probe all databases at once so one unreachable host doesn't delay the others
+        results = await asyncio.gather(
+            asyncio.to_thread(self._check_postgres),
+            asyncio.to_thread(self._check_redis),
+            asyncio.to_thread(self._check_elasticsearch),
+        )
+        return all(results)
+
+    def _check_postgres(self) -> bool:
+        """Check PostgreSQL connectivity."""
         try:
-            import psycopg2
-
-            conn = psycopg2.connect(
-                host=self.config["database"]["postgres"]["host"],
-                port=self.config["database"]["postgres"]["port"],
-                database=self.config["database"]["postgres"]["database"],
-                user=self.config["database"]["postgres"]["user"],
-                password=self.config["database"]["postgres"]["password"],
-            )
-            conn.close()
+            # The pooled connection is reused by the schema initialization
+            with self._db_engine().connect():
+                pass
             logger.info("✓ PostgreSQL connection successful")
+            return True
         except Exception as e:
             logger.error(f"✗ PostgreSQL connection failed: {e}")
             return False
 
-        # Check Redis
+    def _check_redis(self) -> bool:
+        """Check Redis connectivity."""
         try:
             import redis
 
@@ -118,125 +169,97 @@ class ServiceInitializer:
                 host=self.config["database"]["redis"]["host"],
                 port=self.config["database"]["redis"]["port"],
                 db=self.config["database"]["redis"]["db"],
+                socket_connect_timeout=CONNECT_TIMEOUT,
             )
             r.ping()
             logger.info("✓ Redis connection successful")
+            return True
         except Exception as e:
             logger.error(f"✗ Redis connection failed: {e}")
             return False
 
-        # Check Elasticsearch
+    def _check_elasticsearch(self) -> bool:
+        """Check Elasticsearch connectivity."""
         try:
-            from elasticsearch import Elasticsearch
-
-            es = Elasticsearch(
-                [
-                    f"{self.config['database']['elasticsearch']['host']}:"
-                    f"{self.config['database']['elasticsearch']['port']}",
-                ],
-            )
-            es.info()
+            self._es_client().options(request_timeout=CONNECT_TIMEOUT).info()
             logger.info("✓ Elasticsearch connection successful")
+            return True
         except Exception as e:
             logger.error(f"✗ Elasticsearch connection failed: {e}")
             return False
 
-        return True
-
     async def initialize_database_schema(self):
         """Initialize database schema."""
+        await asyncio.to_thread(self._initialize_database_schema)
+
+    def _initialize_database_schema(self):
+        """Create the database tables with the blocking SQLAlchemy client."""
         logger.info("Initializing database schema...")
 
         try:
-            from sqlalchemy import create_engine
             from sqlalchemy.sql import text
 
-            # Create database URL
-            db_config = self.config["database"]["postgres"]
-            db_url = (
-                f"postgresql://{db_config['user']}:{db_config['password']}@"
-                f"{db_config['host']}:{db_config['port']}/{db_config['database']}"
-            )
-
-            # Create engine
-            engine = create_engine(db_url)
-
             # Create tables
-            with engine.connect() as conn:
+            tables = [
                 # Documents table
-                conn.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS documents (
-                        id SERIAL PRIMARY KEY,
-                        title VARCHAR(255),
-                        content TEXT,
-                        file_path VARCHAR(500),
-                        file_type VARCHAR(50),
-                        metadata JSONB,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """,
-                    ),
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    id SERIAL PRIMARY KEY,
+                    title VARCHAR(255),
+                    content TEXT,
+                    file_path VARCHAR(500),
+                    file_type VARCHAR(50),
+                    metadata JSONB,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-
-                # Wiki articles table
-                conn.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS wiki_articles (
-                        id SERIAL PRIMARY KEY,
-                        article_id VARCHAR(255) UNIQUE,
-                        title VARCHAR(255),
-                        content TEXT,
-                        concepts JSONB,
-                        links JSONB,
-                        metadata JSONB,
-                        version INTEGER DEFAULT 1,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
                 """,
-                    ),
+                # Wiki articles table
+                """
+                CREATE TABLE IF NOT EXISTS wiki_articles (
+                    id SERIAL PRIMARY KEY,
+                    article_id VARCHAR(255) UNIQUE,
+                    title VARCHAR(255),
+                    content TEXT,
+                    concepts JSONB,
+                    links JSONB,
+                    metadata JSONB,
+                    version INTEGER DEFAULT 1,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-
-                # RAG embeddings table
-                conn.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS embeddings (
-                        id SERIAL PRIMARY KEY,
-                        document_id INTEGER REFERENCES documents(id),
-                        chunk_text TEXT,
-                        embedding VECTOR(384),
-                        metadata JSONB,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
                 """,
-                    ),
+                # RAG embeddings table
+                """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    id SERIAL PRIMARY KEY,
+                    document_id INTEGER REFERENCES documents(id),
+                    chunk_text TEXT,
+                    embedding VECTOR(384),
+                    metadata JSONB,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-
-                # Service logs table
-                conn.execute(
-                    text(
-                        """
-                    CREATE TABLE IF NOT EXISTS service_logs (
-                        id SERIAL PRIMARY KEY,
-                        service_name VARCHAR(100),
-                        action VARCHAR(100),
-                        status VARCHAR(50),
-                        request_data JSONB,
-                        response_data JSONB,
-                        error_message TEXT,
-                        duration_ms INTEGER,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
                 """,
-                    ),
+                # Service logs table
+                """
+                CREATE TABLE IF NOT EXISTS service_logs (
+                    id SERIAL PRIMARY KEY,
+                    service_name VARCHAR(100),
+                    action VARCHAR(100),
+                    status VARCHAR(50),
+                    request_data JSONB,
+                    response_data JSONB,
+                    error_message TEXT,
+                    duration_ms INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
+                """,
+            ]
 
-                conn.commit()
+            # Send all statements in one round-trip; engine.begin() commits them
+            # together or rolls them all back
+            with self._db_engine().begin() as conn:
+                conn.execute(text(";".join(tables)))
 
             logger.info("✓ Database schema initialized")
 
@@ -246,20 +269,23 @@ class ServiceInitializer:
 
     async def create_elasticsearch_indices(self):
         """Create Elasticsearch indices."""
+        await asyncio.to_thread(self._create_elasticsearch_indices)
+
+    def _create_elasticsearch_indices(self):
+        """Create the indices with the blocking Elasticsearch client."""
         logger.info("Creating Elasticsearch indices...")
 
         try:
-            from elasticsearch import Elasticsearch
+            es = self._es_client()
 
-            es = Elasticsearch(
-                [
-                    f"{self.config['database']['elasticsearch']['host']}:"
-                    f"{self.config['database']['elasticsearch']['port']}",
-                ],
-            )
+            # Look up which of our indices already exist in a single request
+            existing = {
+                index["index"]
+                for index in es.cat.indices(index="noteparser-*", h="index", format="json")
+            }
 
             # Documents index
-            if not es.indices.exists(index="noteparser-documents"):
+            if "noteparser-documents" not in existing:
                 es.indices.create(
                     index="noteparser-documents",
                     body={
@@ -278,7 +304,7 @@ class ServiceInitializer:
                 logger.info("✓ Created documents index")
 
             # Wiki index
-            if not es.indices.exists(index="noteparser-wiki"):
+            if "noteparser-wiki" not in existing:
                 es.indices.create(
                     index="noteparser-wiki",
                     body={
@@ -318,7 +344,7 @@ class ServiceInitializer:
             logger.error(f"✗ Failed to initialize AI services: {e}")
             raise
 
-    async def load_sample_data(self):
+    async def load_sample_data(self, ai_integration: AIServicesIntegration | None = None):
         """Load sample data for testing."""
         logger.info("Loading sample data...")
 
@@ -336,11 +362,18 @@ class ServiceInitializer:
         ]
 
         # Process sample documents
-        ai_integration = await self.initialize_ai_services()
-
-        for doc in sample_documents:
-            result = await ai_integration.process_document(doc)
-            logger.info(f"Processed sample document: {doc['title']}")
+        if ai_integration is None:
+            ai_integration = await self.initialize_ai_services()
+
+        results = await asyncio.gather(
+            *(ai_integration.process_document(doc) for doc in sample_documents),
+            return_exceptions=True,
+        )
+        for doc, result in zip(sample_documents, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"✗ Failed to process sample document {doc['title']}: {result}")
+            else:
+                logger.info(f"Processed sample document: {doc['title']}")
 
         logger.info("✓ Sample data loaded")
 
@@ -354,18 +387,17 @@ class ServiceInitializer:
                 logger.error("Database connections failed. Please ensure all services are running.")
                 return False
 
-            # Initialize database schema
-            await self.initialize_database_schema()
-
-            # Create Elasticsearch indices
-            await self.create_elasticsearch_indices()
-
-            # Initialize AI services
-            await self.initialize_ai_services()
+            # Database schema, Elasticsearch indices and AI services are
+            # independent of each other, so set them up concurrently
+            _, _, ai_integration = await asyncio.gather(
+                self.initialize_database_schema(),
+                self.create_elasticsearch_indices(),
+                self.initialize_ai_services(),
+            )
 
             # Optionally load sample data
             if os.getenv("LOAD_SAMPLE_DATA", "false").lower() == "true":
-                await self.load_sample_data()
+                await self.load_sample_data(ai_integration)
 
             logger.info("✓ Service initialization completed successfully!")
             return True
@@ -395,4 +427,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,7 +4,11 @@ Microservices module for noteparser integrations.
 This module contains the service layer for various AI/ML integrations.
 """
 
+import asyncio
+import inspect
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -13,34 +17,59 @@ logger = logging.getLogger(__name__)
 class ServiceRegistry:
     """Registry for managing microservices."""
 
-    def __init__(self):
+    def __init__(self, health_ttl: float = 20.0):
         self._services: dict[str, Any] = {}
-        self._health_checks: dict[str, bool] = {}
+        self._probes: dict[str, Callable[[], bool | Awaitable[bool]] | None] = {}
+        self._health_cache: dict[str, tuple[float, bool]] = {}
+        self._health_ttl = health_ttl
 
     def register(self, name: str, service: Any) -> None:
         """Register a new service."""
         self._services[name] = service
-        self._health_checks[name] = False
+        self._probes[name] = getattr(service, "health_check", None)
+        self.invalidate(name)
         logger.info(f"Registered service: {name}")
 
+    def unregister(self, name: str) -> None:
+        """Remove a registered service."""
+        self._services.pop(name, None)
+        self._probes.pop(name, None)
+        self.invalidate(name)
+        logger.info(f"Unregistered service: {name}")
+
     def get(self, name: str) -> Any | None:
         """Get a registered service."""
         return self._services.get(name)
 
-    def health_check(self, name: str) -> bool:
-        """Check health of a specific service."""
+    def invalidate(self, name: str) -> None:
+        """Drop the cached health result so the next check probes the service again."""
+        self._health_cache.pop(name, None)
+
+    async def health_check(self, name: str) -> bool:
+        """Check health of a specific service, reusing results newer than the TTL."""
         if name not in self._services:
             return False
 
-        service = self._services[name]
-        if hasattr(service, "health_check"):
-            self._health_checks[name] = service.health_check()
+        now = time.monotonic()
+        cached = self._health_cache.get(name)
+        if cached is not None and now - cached[0] < self._health_ttl:
+            return cached[1]
+
+        probe = self._probes[name]
+        healthy = False
+        if probe is not None:
+            # Services may implement health_check either synchronously or as a coroutine
+            result = probe()
+            healthy = await result if inspect.isawaitable(result) else result
+        self._health_cache[name] = (now, healthy)
 
-        return self._health_checks.get(name, False)
+        return healthy
 
-    def get_all_health_status(self) -> dict[str, bool]:
-        """Get health status of all services."""
-        return {name: self.health_check(name) for name in self._services}
+    async def get_all_health_status(self) -> dict[str, bool]:
+        """Get health status of all services, checking them concurrently."""
+        names = list(self._services)
+        results = await asyncio.gather(*(self.health_check(name) for name in names))
+        return dict(zip(names, results, strict=True))
 
 
 # Global service registry
@@ -3,13 +3,18 @@ Base service class for all microservices.
 """
 
 import asyncio
+import contextlib
+import heapq
 import logging
+import random
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -33,29 +38,43 @@ class BaseService(ABC):
     def __init__(self, config: ServiceConfig):
         self.config = config
         self.is_healthy = False
-        self.last_health_check = None
+        # Monotonic time of the last health check, 0.0 if none has run yet
+        self.last_health_check_monotonic = 0.0
+        self._timeout = aiohttp.ClientTimeout(total=config.timeout)
         self._session: aiohttp.ClientSession | None = None
-        self._health_check_task = None
+        self._owns_session = False
 
-    async def start(self):
-        """Start the service."""
+    async def start(self, session: aiohttp.ClientSession | None = None):
+        """
+        Start the service.
+
+        A shared session may be passed in, in which case the caller owns it
+        and is responsible for closing it.
+        """
         logger.info(f"Starting service: {self.config.name}")
-        self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-        )
-        # Start health check background task
-        self._health_check_task = asyncio.create_task(self._health_check_loop())
+        if session is not None:
+            self._session = session
+            self._owns_session = False
+        else:
+            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            self._owns_session = True
         await self.initialize()
 
     async def stop(self):
         """Stop the service."""
         logger.info(f"Stopping service: {self.config.name}")
-        if self._health_check_task:
-            self._health_check_task.cancel()
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
         await self.cleanup()
 
+    @property
+    def last_health_check(self) -> datetime | None:
+        """Wall-clock time (UTC) of the last health check, if one has run."""
+        if not self.last_health_check_monotonic:
+            return None
+        elapsed = time.monotonic() - self.last_health_check_monotonic
+        return datetime.now(timezone.utc) - timedelta(seconds=elapsed)
+
     @abstractmethod
     async def initialize(self):
         """Initialize service-specific resources."""
@@ -84,22 +103,29 @@ class BaseService(ABC):
 
         try:
             url = f"http://{self.config.host}:{self.config.port}/health"
-            async with self._session.get(url) as response:
+            async with self._request("GET", url) as response:
                 return response.status == 200
-        except:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"Health endpoint unreachable for {self.config.name}: {e}")
             return False
 
-    async def _health_check_loop(self):
-        """Background task for periodic health checks."""
-        while True:
-            try:
-                await asyncio.sleep(self.config.health_check_interval)
-                self.is_healthy = await self.health_check()
-                self.last_health_check = datetime.utcnow()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in health check loop: {e}")
+    def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """
+        Start a request on the service's session with its configured timeout.
+
+        The session may be shared between services, so its own default timeout
+        isn't this service's; use this rather than calling the session directly.
+        """
+        kwargs.setdefault("timeout", self._timeout)
+        return self._session.request(method, url, **kwargs)
+
+    async def _refresh_health(self):
+        """Run a health check and record its result."""
+        try:
+            self.is_healthy = await self.health_check()
+            self.last_health_check_monotonic = time.monotonic()
+        except Exception as e:
+            logger.error(f"Error in periodic health check for {self.config.name}: {e}")
 
     async def call_api(
         self,
@@ -112,30 +138,110 @@ class BaseService(ABC):
             raise RuntimeError(f"Service {self.config.name} not started")
 
         url = f"http://{self.config.host}:{self.config.port}/{endpoint}"
+        body = orjson.dumps(data) if data is not None else None
+        headers = {"Content-Type": "application/json"} if data is not None else None
 
         for attempt in range(self.config.retry_count):
             try:
-                async with self._session.request(method, url, json=data) as response:
+                async with self._request(method, url, data=body, headers=headers) as response:
                     response.raise_for_status()
-                    return await response.json()
+                    return await response.json(loads=orjson.loads)
             except Exception as e:
                 if attempt == self.config.retry_count - 1:
                     raise
                 logger.warning(f"API call failed (attempt {attempt + 1}): {e}")
-                await asyncio.sleep(2**attempt)  # Exponential backoff
+                # Exponential backoff with full jitter so callers don't retry in lockstep
+                await asyncio.sleep(random.uniform(0, min(2**attempt, 10)))
 
 
 class ServiceOrchestrator:
-    """Orchestrates multiple services."""
+    """
+    Orchestrates multiple services.
+
+    Periodic health checks for all registered services are driven by a single
+    scheduler task, which wakes only when the next check is due and starts each
+    due check as its own task, so a slow probe doesn't delay the others.
+    """
 
-    def __init__(self):
+    def __init__(self, max_concurrent_health_checks: int = 16):
         self.services: dict[str, BaseService] = {}
+        self._session: aiohttp.ClientSession | None = None
+        # (next due time on the monotonic clock, service name)
+        self._health_schedule: list[tuple[float, str]] = []
+        # Services with a check queued or running, so each is scheduled only once
+        self._health_scheduled: set[str] = set()
+        self._health_tasks: set[asyncio.Task] = set()
+        self._schedule_changed = asyncio.Event()
+        self._health_semaphore = asyncio.Semaphore(max_concurrent_health_checks)
+        self._scheduler_task: asyncio.Task | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all services, creating it on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                # ServiceConfig's default; BaseService._request applies each service's own
+                timeout=aiohttp.ClientTimeout(total=ServiceConfig.timeout),
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=75),
+            )
+        return self._session
 
     async def register_service(self, service: BaseService):
         """Register and start a service."""
-        await service.start()
-        self.services[service.config.name] = service
-        logger.info(f"Registered service: {service.config.name}")
+        name = service.config.name
+        await service.start(session=self._get_session())
+        self.services[name] = service
+        # A re-registered service replaces the old one but keeps its place in the schedule
+        if name not in self._health_scheduled:
+            self._health_scheduled.add(name)
+            self._schedule_health_check(
+                name,
+                time.monotonic() + service.config.health_check_interval,
+            )
+        logger.info(f"Registered service: {name}")
+
+    async def unregister_service(self, name: str):
+        """Stop a service and remove it; its pending health check is dropped when due."""
+        service = self.services.pop(name, None)
+        if service is not None:
+            await service.stop()
+            logger.info(f"Unregistered service: {name}")
+
+    def _schedule_health_check(self, name: str, due_at: float):
+        """Queue the next health check of a service and make sure the scheduler runs."""
+        heapq.heappush(self._health_schedule, (due_at, name))
+        self._schedule_changed.set()
+        if self._scheduler_task is None:
+            self._scheduler_task = asyncio.create_task(self._health_scheduler())
+
+    async def _run_health_check(self, name: str, due_at: float):
+        """Run one scheduled health check, bounded by the concurrency limit, and queue the next."""
+        service = self.services.get(name)
+        if service is None:
+            self._health_scheduled.discard(name)
+            return
+
+        async with self._health_semaphore:
+            await service._refresh_health()
+
+        # Ticks missed while the check or the event loop was stalled are skipped, not replayed
+        next_due = max(due_at + service.config.health_check_interval, time.monotonic())
+        self._schedule_health_check(name, next_due)
+
+    async def _health_scheduler(self):
+        """Background task starting every service's periodic health checks."""
+        while True:
+            self._schedule_changed.clear()
+            now = time.monotonic()
+            while self._health_schedule and self._health_schedule[0][0] <= now:
+                due_at, name = heapq.heappop(self._health_schedule)
+                task = asyncio.create_task(self._run_health_check(name, due_at))
+                self._health_tasks.add(task)
+                task.add_done_callback(self._health_tasks.discard)
+
+            # Sleep until the next check is due, or until the schedule changes
+            timeout = self._health_schedule[0][0] - now if self._health_schedule else None
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._schedule_changed.wait(), timeout)
 
     async def process_pipeline(self, data: dict[str, Any], pipeline: list[str]) -> dict[str, Any]:
         """Process data through a pipeline of services."""
@@ -152,5 +258,18 @@ class ServiceOrchestrator:
 
     async def shutdown(self):
         """Shutdown all services."""
+        tasks = list(self._health_tasks)
+        if self._scheduler_task:
+            tasks.append(self._scheduler_task)
+            self._scheduler_task = None
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled tasks finish before their services are stopped
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._health_schedule.clear()
+        self._health_scheduled.clear()
         for service in self.services.values():
             await service.stop()
+        if self._session:
+            await self._session.close()
+            self._session = None
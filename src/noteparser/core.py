@@ -7,7 +7,6 @@ from markitdown import MarkItDown
 
 from .converters.latex import LatexConverter
 from .exceptions import ConversionError, UnsupportedFormatError
-from .integration.ai_services import AIServicesIntegration
 from .utils.metadata import MetadataExtractor
 
 
@@ -71,6 +70,9 @@ class NoteParser:
         self.ai_integration = None
         if enable_ai:
             try:
+                # Imported here so parsers without AI don't load the HTTP client stack
+                from .integration.ai_services import AIServicesIntegration
+
                 self.ai_integration = AIServicesIntegration(config)
             except ImportError as e:
                 print(f"Warning: AI services not available: {e}")
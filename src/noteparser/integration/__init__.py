@@ -1,7 +1,23 @@
 """Integration modules for multi-repository organization."""
 
-from .ai_services import AIServicesIntegration
-from .org_sync import OrganizationSync
-from .service_client import AIServiceClient, ServiceClientManager
+from importlib import import_module
+from typing import Any
 
 __all__ = ["AIServiceClient", "AIServicesIntegration", "OrganizationSync", "ServiceClientManager"]
+
+# Exports are imported on first access so that using one integration (e.g.
+# org_sync) doesn't pull in the HTTP client stack behind the AI services
+_EXPORTS = {
+    "AIServiceClient": ".service_client",
+    "AIServicesIntegration": ".ai_services",
+    "OrganizationSync": ".org_sync",
+    "ServiceClientManager": ".service_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -4,11 +4,12 @@ AI Services Integration Module
 Integrates various AI/ML services into the noteparser workflow.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
 
-from .service_client import ServiceClientManager
+from .service_client import AIServiceClient, ServiceClientManager
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,21 @@ class AIServicesIntegration:
         self.config = config or {}
         self.manager = ServiceClientManager()
         self.services_initialized = False
+        # Direct references to the clients, resolved once instead of per request
+        self._ragflow: AIServiceClient | None = None
+        self._deepwiki: AIServiceClient | None = None
+
+    def _get_ragflow(self) -> AIServiceClient:
+        """Get the RagFlow client, looking it up on first use only."""
+        if self._ragflow is None:
+            self._ragflow = self.manager.get_client("ragflow")
+        return self._ragflow
+
+    def _get_deepwiki(self) -> AIServiceClient:
+        """Get the DeepWiki client, looking it up on first use only."""
+        if self._deepwiki is None:
+            self._deepwiki = self.manager.get_client("deepwiki")
+        return self._deepwiki
 
     async def initialize(self) -> bool:
         """Initialize all AI services."""
@@ -54,40 +70,58 @@ class AIServicesIntegration:
         if not self.services_initialized:
             raise RuntimeError("AI services not initialized")
 
-        results = {}
+        results: dict[str, Any] = {}
 
         # Extract content and metadata
         content = document.get("content", "")
         metadata = document.get("metadata", {})
 
-        # Process through RagFlow for indexing and insights
-        try:
-            ragflow = self.manager.get_client("ragflow")
+        # RagFlow and DeepWiki are independent, so process through both at once
+        for partial in await asyncio.gather(
+            self._process_with_ragflow(content, metadata),
+            self._process_with_deepwiki(content, metadata),
+        ):
+            results.update(partial)
 
-            # Index document
-            rag_result = await ragflow.post("index", {"content": content, "metadata": metadata})
-            results["rag_indexing"] = rag_result
+        return results
+
+    async def _process_with_ragflow(self, content: str, metadata: dict) -> dict[str, Any]:
+        """Index a document and extract insights from it through RagFlow."""
+        results: dict[str, Any] = {}
+        index_payload = {"content": content, "metadata": metadata}
+        insights_payload = {"content": content}
+        try:
+            ragflow = self._get_ragflow()
 
-            # Extract insights
-            insights = await ragflow.post("extract_insights", {"content": content})
-            results["ragflow_insights"] = insights
+            # Indexing and insight extraction don't depend on each other
+            rag_result, insights = await asyncio.gather(
+                ragflow.post("index", index_payload),
+                ragflow.post("extract_insights", insights_payload),
+                return_exceptions=True,
+            )
+            for key, result in (("rag_indexing", rag_result), ("ragflow_insights", insights)):
+                if isinstance(result, Exception):
+                    raise result
+                results[key] = result
 
         except Exception as e:
             logger.exception(f"RagFlow processing failed: {e}")
             results["rag_error"] = {"error": str(e)}
 
-        # Create wiki article
+        return results
+
+    async def _process_with_deepwiki(self, content: str, metadata: dict) -> dict[str, Any]:
+        """Create a wiki article for a document through DeepWiki."""
+        results: dict[str, Any] = {}
+        article_payload = {
+            "title": metadata.get("title", "Untitled"),
+            "content": content,
+            "metadata": metadata,
+        }
         try:
-            deepwiki = self.manager.get_client("deepwiki")
+            deepwiki = self._get_deepwiki()
 
-            wiki_result = await deepwiki.post(
-                "create_article",
-                {
-                    "title": metadata.get("title", "Untitled"),
-                    "content": content,
-                    "metadata": metadata,
-                },
-            )
+            wiki_result = await deepwiki.post("create_article", article_payload)
             results["deepwiki_article"] = wiki_result
 
         except Exception as e:
@@ -101,15 +135,24 @@ class AIServicesIntegration:
         if not self.services_initialized:
             raise RuntimeError("AI services not initialized")
 
-        results = {}
+        results: dict[str, Any] = {}
+
+        # Query RagFlow and DeepWiki at the same time
+        for partial in await asyncio.gather(
+            self._query_ragflow(query, filters),
+            self._query_deepwiki(query),
+        ):
+            results.update(partial)
+
+        return results
 
-        # Query through RagFlow
+    async def _query_ragflow(self, query: str, filters: dict | None) -> dict[str, Any]:
+        """Query RagFlow for matching documents and an answer."""
+        results: dict[str, Any] = {}
+        query_payload = {"query": query, "k": 5, "filters": filters or {}}
         try:
-            ragflow = self.manager.get_client("ragflow")
-            rag_response = await ragflow.post(
-                "query",
-                {"query": query, "k": 5, "filters": filters or {}},
-            )
+            ragflow = self._get_ragflow()
+            rag_response = await ragflow.post("query", query_payload)
             # Extract documents and answer from the response
             results["documents"] = rag_response.get("documents", [])
             results["answer"] = rag_response.get("answer", "")
@@ -117,17 +160,26 @@ class AIServicesIntegration:
             logger.exception(f"RagFlow query failed: {e}")
             results["rag_error"] = {"error": str(e)}
 
-        # Query through DeepWiki
-        try:
-            deepwiki = self.manager.get_client("deepwiki")
+        return results
 
-            # Search wiki
-            wiki_search = await deepwiki.post("search", {"query": query, "limit": 5})
-            results["wiki_search"] = wiki_search
+    async def _query_deepwiki(self, query: str) -> dict[str, Any]:
+        """Search the wiki and ask the DeepWiki assistant."""
+        results: dict[str, Any] = {}
+        search_payload = {"query": query, "limit": 5}
+        ask_payload = {"question": query}
+        try:
+            deepwiki = self._get_deepwiki()
 
-            # Ask AI assistant
-            ai_response = await deepwiki.post("ask", {"question": query})
-            results["ai_assistant"] = ai_response
+            # The search and the assistant question are independent
+            wiki_search, ai_response = await asyncio.gather(
+                deepwiki.post("search", search_payload),
+                deepwiki.post("ask", ask_payload),
+                return_exceptions=True,
+            )
+            for key, result in (("wiki_search", wiki_search), ("ai_assistant", ai_response)):
+                if isinstance(result, Exception):
+                    raise result
+                results[key] = result
 
         except Exception as e:
             logger.exception(f"DeepWiki query failed: {e}")
@@ -144,7 +196,7 @@ class AIServicesIntegration:
 
         # Get knowledge graph from DeepWiki
         try:
-            deepwiki = self.manager.get_client("deepwiki")
+            deepwiki = self._get_deepwiki()
             graph_result = await deepwiki.get("graph")
             results["knowledge_graph"] = graph_result
         except Exception as e:
@@ -157,6 +209,8 @@ class AIServicesIntegration:
         """Shutdown all services."""
         if self.manager:
             await self.manager.close_all()
+            self._ragflow = None
+            self._deepwiki = None
             self.services_initialized = False
             logger.info("All AI services connections closed")
 
@@ -5,14 +5,48 @@ Service Client for connecting to deployed AI services.
 import asyncio
 import logging
 import os
+import time
 from pathlib import Path
 from typing import Any
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Connection pool limits for the clients talking to the AI services
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=75.0)
+
+
+def _create_http_client(timeout: float) -> httpx.AsyncClient:
+    """
+    Create a client with the pool limits used for AI services.
+
+    HTTP/2 is only negotiated via TLS ALPN, so it applies to https:// service
+    URLs; plain http:// endpoints (the defaults) stay on keep-alive HTTP/1.1.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=True,
+        limits=HTTP_LIMITS,
+        follow_redirects=True,
+    )
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Only transport failures and 5xx responses are worth retrying; 4xx won't change."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
 
 class ServiceClientManager:
     """Manager for all AI service clients."""
@@ -20,6 +54,13 @@ class ServiceClientManager:
     def __init__(self, config_path: str | None = None):
         self.clients: dict[str, AIServiceClient] = {}
         self.config = self._load_config(config_path)
+        self._http_client: httpx.AsyncClient | None = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client shared by all service clients, creating it on first use."""
+        if self._http_client is None:
+            self._http_client = _create_http_client(timeout=30)
+        return self._http_client
 
     def _load_config(self, config_path: str | None) -> dict[str, Any]:
         """Load configuration from file or environment variables."""
@@ -86,43 +127,55 @@ class ServiceClientManager:
 
     def get_client(self, service_name: str) -> "AIServiceClient":
         """Get or create a client for the specified service."""
-        if service_name not in self.clients:
-            service_config = self.config["services"].get(service_name)
-            if not service_config:
-                raise ValueError(f"Service {service_name} not configured")
-
-            base_url = service_config["base_url"]
-            # Use specialized clients if available
-            if service_name == "ragflow":
-                self.clients[service_name] = RagFlowClient(base_url)
-            elif service_name == "deepwiki":
-                self.clients[service_name] = DeepWikiClient(base_url)
-            else:
-                self.clients[service_name] = AIServiceClient(service_name, base_url)
+        client = self.clients.get(service_name)
+        if client is not None:
+            return client
+
+        service_config = self.config["services"].get(service_name)
+        if not service_config:
+            raise ValueError(f"Service {service_name} not configured")
+
+        base_url = service_config["base_url"]
+        http_client = self._get_http_client()
+        # Use specialized clients if available
+        if service_name == "ragflow":
+            client = RagFlowClient(base_url, client=http_client)
+        elif service_name == "deepwiki":
+            client = DeepWikiClient(base_url, client=http_client)
+        else:
+            client = AIServiceClient(service_name, base_url, client=http_client)
 
-        return self.clients[service_name]
+        self.clients[service_name] = client
+        return client
 
     async def health_check_all(self) -> dict[str, dict[str, Any]]:
-        """Check health of all configured services."""
-        results = {}
-        for service_name in self.config["services"]:
-            if self.config["services"][service_name].get("enabled", True):
-                try:
-                    client = self.get_client(service_name)
-                    health_result = await client.health_check()
-                    if isinstance(health_result, bool):
-                        results[service_name] = {
-                            "status": "healthy" if health_result else "unhealthy",
-                        }
-                    else:
-                        results[service_name] = health_result
-                except Exception as e:
-                    logger.exception(f"Health check failed for {service_name}: {e}")
-                    results[service_name] = {"status": "unhealthy", "error": str(e)}
+        """Check health of all configured services concurrently."""
+        results: dict[str, dict[str, Any]] = {}
+        enabled = []
+        for service_name, service_config in self.config["services"].items():
+            if service_config.get("enabled", True):
+                enabled.append(service_name)
             else:
                 results[service_name] = {"status": "disabled"}
+
+        health_results = await asyncio.gather(
+            *(self._check_service_health(service_name) for service_name in enabled),
+        )
+        results.update(zip(enabled, health_results, strict=True))
         return results
 
+    async def _check_service_health(self, service_name: str) -> dict[str, Any]:
+        """Check health of a single service, reporting failures as unhealthy."""
+        try:
+            client = self.get_client(service_name)
+            health_result = await client.health_check()
+            if isinstance(health_result, bool):
+                return {"status": "healthy" if health_result else "unhealthy"}
+            return health_result
+        except Exception as e:
+            logger.exception(f"Health check failed for {service_name}: {e}")
+            return {"status": "unhealthy", "error": str(e)}
+
     async def close_all(self):
         """Close all client connections."""
         for client in self.clients.values():
@@ -132,27 +185,68 @@ class ServiceClientManager:
                 await client.client.aclose()
         self.clients.clear()
 
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
 
 class AIServiceClient:
-    """Client for communicating with deployed AI services."""
+    """
+    Client for communicating with deployed AI services.
+
+    An existing httpx.AsyncClient can be passed in to share its connection
+    pool; the caller then owns it and ``timeout`` is left to that client.
+    Health check results are reused for ``health_ttl`` seconds. At most
+    ``max_concurrency`` requests from this client are in flight at once; the
+    limit is per client, even when the underlying httpx client is shared.
+    """
 
-    def __init__(self, service_name: str, base_url: str, timeout: int = 30):
+    def __init__(
+        self,
+        service_name: str,
+        base_url: str,
+        timeout: int = 30,
+        client: httpx.AsyncClient | None = None,
+        health_ttl: float = 10.0,
+        max_concurrency: int = 32,
+    ):
         self.service_name = service_name
         self.base_url = base_url.rstrip("/")
+        # Prefixes for request URLs, so each call only appends the endpoint
+        self._url = f"{self.base_url}/"
+        self._health_url = f"{self._url}health"
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        self._health_ttl = health_ttl
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_client = client is None
+        self.client = client if client is not None else _create_http_client(timeout)
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
+
+    def invalidate_health(self) -> None:
+        """Forget the cached health result so the next check probes the service."""
+        self._health_cache = None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def health_check(self) -> dict[str, Any]:
-        """Check if service is healthy."""
+        """Check if service is healthy; a failed probe is reported, not retried."""
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self._health_ttl:
+            return self._health_cache[1]
+
+        result = await self._probe_health()
+        self._health_cache = (now, result)
+        return result
+
+    async def _probe_health(self) -> dict[str, Any]:
         try:
-            response = await self.client.get(f"{self.base_url}/health")
+            async with self._semaphore:
+                response = await self.client.get(self._health_url)
             if response.status_code == 200:
                 try:
                     health_data = response.json()
@@ -165,44 +259,68 @@ class AIServiceClient:
             logger.exception(f"Health check failed for {self.service_name}: {e}")
             return {"status": "unhealthy", "error": str(e)}
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """Make POST request to service."""
         try:
-            response = await self.client.post(f"{self.base_url}/{endpoint}", json=data)
-            response.raise_for_status()
-            result: dict[str, Any] = response.json()
-            return result
+            return await self._post(endpoint, data)
         except httpx.HTTPStatusError as e:
             logger.exception(f"HTTP error from {self.service_name}: {e}")
             return {"status": "error", "error": str(e)}
         except Exception as e:
             logger.exception(f"Error calling {self.service_name}: {e}")
+            self.invalidate_health()
             return {"status": "error", "error": str(e)}
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def get(self, endpoint: str, params: dict | None = None) -> dict[str, Any]:
         """Make GET request to service."""
         try:
-            response = await self.client.get(f"{self.base_url}/{endpoint}", params=params)
-            response.raise_for_status()
-            result: dict[str, Any] = response.json()
-            return result
+            return await self._get(endpoint, params)
         except httpx.HTTPStatusError as e:
             logger.exception(f"HTTP error from {self.service_name}: {e}")
             return {"status": "error", "error": str(e)}
         except Exception as e:
             logger.exception(f"Error calling {self.service_name}: {e}")
+            self.invalidate_health()
             return {"status": "error", "error": str(e)}
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(multiplier=1, max=10),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )
+    async def _post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        async with self._semaphore:
+            response = await self.client.post(
+                self._url + endpoint,
+                content=orjson.dumps(data),
+                headers=JSON_HEADERS,
+            )
+        response.raise_for_status()
+        result: dict[str, Any] = orjson.loads(response.content)
+        return result
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_random_exponential(multiplier=1, max=10),
+        retry=retry_if_exception(_is_retryable),
+        reraise=True,
+    )
+    async def _get(self, endpoint: str, params: dict | None) -> dict[str, Any]:
+        async with self._semaphore:
+            response = await self.client.get(self._url + endpoint, params=params)
+        response.raise_for_status()
+        result: dict[str, Any] = orjson.loads(response.content)
+        return result
+
 
 class RagFlowClient(AIServiceClient):
     """Client specifically for RagFlow service."""
 
-    def __init__(self, base_url: str | None = None):
+    def __init__(self, base_url: str | None = None, client: httpx.AsyncClient | None = None):
         if base_url is None:
             base_url = os.getenv("RAGFLOW_URL", "http://localhost:8010")
-        super().__init__("ragflow", base_url)
+        super().__init__("ragflow", base_url, client=client)
 
     async def index_document(self, content: str, metadata: dict[str, Any]) -> dict[str, Any]:
         """Index a document in RagFlow."""
@@ -224,10 +342,10 @@ class RagFlowClient(AIServiceClient):
 class DeepWikiClient(AIServiceClient):
     """Client specifically for DeepWiki service."""
 
-    def __init__(self, base_url: str | None = None):
+    def __init__(self, base_url: str | None = None, client: httpx.AsyncClient | None = None):
         if base_url is None:
             base_url = os.getenv("DEEPWIKI_URL", "http://localhost:8011")
-        super().__init__("deepwiki", base_url)
+        super().__init__("deepwiki", base_url, client=client)
 
     async def create_article(
         self,
@@ -1,20 +1,48 @@
 """API blueprint for web interface."""
 
+import json
+
 from flask import Blueprint, Response, jsonify
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
+# Static payloads are serialized once instead of on every request
+_HEALTH_BODY = json.dumps(
+    {
+        "status": "healthy",
+        "version": "2.1.0",
+        "services": {"parser": "available", "ai_integration": "available"},
+    },
+).encode()
+_PLUGINS_BODY = json.dumps(
+    {
+        "plugins": [
+            {
+                "name": "math_plugin",
+                "type": "course",
+                "description": "Mathematics course processor",
+            },
+            {
+                "name": "cs_plugin",
+                "type": "course",
+                "description": "Computer Science course processor",
+            },
+        ],
+        "total": 2,
+    },
+).encode()
+
+
+def _static_json(body: bytes, cache_control: str) -> Response:
+    """Build a JSON response from a pre-serialized body."""
+    return Response(body, mimetype="application/json", headers={"Cache-Control": cache_control})
+
 
 @api_bp.route("/health", methods=["GET"])
 def health() -> Response:
     """Health check endpoint."""
-    return jsonify(
-        {
-            "status": "healthy",
-            "version": "2.1.0",
-            "services": {"parser": "available", "ai_integration": "available"},
-        },
-    )
+    # Never cached, so a proxy can't report a dead process as healthy
+    return _static_json(_HEALTH_BODY, "no-store")
 
 
 @api_bp.route("/parse/status/<task_id>", methods=["GET"])
@@ -39,23 +67,7 @@ def list_files() -> Response:
 @api_bp.route("/plugins", methods=["GET"])
 def list_plugins() -> Response:
     """List available plugins."""
-    return jsonify(
-        {
-            "plugins": [
-                {
-                    "name": "math_plugin",
-                    "type": "course",
-                    "description": "Mathematics course processor",
-                },
-                {
-                    "name": "cs_plugin",
-                    "type": "course",
-                    "description": "Computer Science course processor",
-                },
-            ],
-            "total": 2,
-        },
-    )
+    return _static_json(_PLUGINS_BODY, "max-age=60")
 
 
 @api_bp.errorhandler(404)
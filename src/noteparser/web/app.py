@@ -9,7 +9,6 @@ from typing import Any
 from flask import Flask, jsonify, render_template, request
 
 from noteparser.core import NoteParser
-from noteparser.integration.ai_services import AIServicesIntegration
 from noteparser.integration.org_sync import OrganizationSync
 from noteparser.plugins.base import PluginManager
 
@@ -50,6 +49,9 @@ def create_app(config: dict[str, Any] | None = None) -> Flask:
     app.config["AI_INTEGRATION"] = None
     if enable_ai:
         try:
+            # Imported here so apps without AI don't load the HTTP client stack
+            from noteparser.integration.ai_services import AIServicesIntegration
+
             app.config["AI_INTEGRATION"] = AIServicesIntegration(config)
         except Exception as e:
             logger.warning(f"AI services not available: {e}")
@@ -0,0 +1,180 @@
+"""
+Gunicorn logger classes for serving the web app.
+
+Select one with gunicorn's ``logger_class`` setting: ``AccessLogger``, or
+``StatsdAccessLogger`` when statsd metrics are enabled.
+"""
+
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+
+from gunicorn.glogging import Logger
+from gunicorn.instrument.statsd import Statsd
+
+
+class _WithoutHeaders:
+    """Request/response proxy that hides headers from Logger.atoms()."""
+
+    headers = ()
+
+    def __init__(self, wrapped):
+        self._wrapped = wrapped
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+
+class _WithoutItems:
+    """WSGI environ proxy that supports lookups but hides items() from Logger.atoms()."""
+
+    def __init__(self, environ):
+        self._environ = environ
+
+    def __getitem__(self, key):
+        return self._environ[key]
+
+    def get(self, key, default=None):
+        return self._environ.get(key, default)
+
+    def items(self):
+        return ()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to its owner instead of flushing every record."""
+
+    def flush(self):
+        pass
+
+    def flush_buffer(self):
+        super().flush()
+
+
+class _AccessLogWriter(threading.Thread):
+    """
+    Background thread writing a worker's queued access log records.
+
+    Writes go through the file buffer and are flushed at least every
+    ``flush_interval`` seconds, and when the writer stops.
+    """
+
+    _STOP = object()
+
+    def __init__(self, handlers: list[_BufferedFileHandler], flush_interval: float):
+        super().__init__(name="access-log-writer", daemon=True)
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handlers = handlers
+        self.flush_interval = flush_interval
+
+    def run(self):
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                record = self.queue.get(timeout=max(next_flush - time.monotonic(), 0))
+            except queue.Empty:
+                record = None
+            if record is self._STOP:
+                break
+            if record is not None:
+                for handler in self.handlers:
+                    handler.handle(record)
+            if time.monotonic() >= next_flush:
+                self.flush()
+                next_flush = time.monotonic() + self.flush_interval
+        self.flush()
+
+    def flush(self):
+        for handler in self.handlers:
+            handler.flush_buffer()
+
+    def reopen(self):
+        """Reopen the log files, e.g. after logrotate moved them away."""
+        for handler in self.handlers:
+            handler.acquire()
+            try:
+                if handler.stream:
+                    handler.close()
+                    handler.stream = handler._open()
+            finally:
+                handler.release()
+
+    def stop(self):
+        """Write out everything queued so far and stop the thread."""
+        self.queue.put(self._STOP)
+        self.join()
+
+
+class _AccessLoggerMixin:
+    """
+    Only expands the ``{header}i``, ``{header}o`` and ``{variable}e`` atoms when
+    access_log_format references them, instead of on every request. This only
+    applies to gunicorn's own workers (sync, gthread, ...): UvicornWorker formats
+    access lines in uvicorn and never calls atoms().
+
+    Workers can also hand their access log file writes to a background writer
+    thread, which the logger reopens along with its other files on SIGUSR1.
+    """
+
+    access_log_writer: _AccessLogWriter | None = None
+
+    def setup(self, cfg):
+        super().setup(cfg)
+        log_format = cfg.access_log_format
+        self._request_headers = "}i)" in log_format
+        self._response_headers = "}o)" in log_format
+        self._environ_variables = "}e)" in log_format
+
+    def atoms(self, resp, req, environ, request_time):
+        return super().atoms(
+            resp if self._response_headers else _WithoutHeaders(resp),
+            req if self._request_headers else _WithoutHeaders(req),
+            environ if self._environ_variables else _WithoutItems(environ),
+            request_time,
+        )
+
+    def start_access_log_writer(self, flush_interval: float):
+        """Hand this worker's access log file writes to a background writer thread."""
+        file_handlers = [h for h in self.access_log.handlers if isinstance(h, logging.FileHandler)]
+        if not file_handlers:
+            return
+
+        buffered_handlers = []
+        for handler in file_handlers:
+            buffered = _BufferedFileHandler(handler.baseFilename, handler.mode, handler.encoding)
+            buffered.setFormatter(handler.formatter)
+            buffered_handlers.append(buffered)
+
+        self.access_log_writer = _AccessLogWriter(buffered_handlers, flush_interval)
+        self.access_log_writer.start()
+        queue_handler = logging.handlers.QueueHandler(self.access_log_writer.queue)
+
+        # UvicornWorker logs requests through "uvicorn.access", which it pointed
+        # at the access log's handlers before post_worker_init runs
+        for log in (self.access_log, logging.getLogger("uvicorn.access")):
+            if any(handler in file_handlers for handler in log.handlers):
+                log.handlers = [h for h in log.handlers if h not in file_handlers] + [queue_handler]
+        for handler in file_handlers:
+            handler.close()
+
+    def stop_access_log_writer(self):
+        """Write out buffered access log lines and stop the writer thread."""
+        if self.access_log_writer is not None:
+            self.access_log_writer.stop()
+            self.access_log_writer = None
+
+    def reopen_files(self):
+        super().reopen_files()
+        # The buffered handlers aren't attached to a logger, so the base class can't see them
+        if self.access_log_writer is not None:
+            self.access_log_writer.reopen()
+
+
+class AccessLogger(_AccessLoggerMixin, Logger):
+    """Gunicorn logger with lazy access log atoms and a buffered access log writer."""
+
+
+class StatsdAccessLogger(_AccessLoggerMixin, Statsd):
+    """AccessLogger that also reports metrics to statsd."""
@@ -121,13 +121,33 @@ class TestAIServiceClient:
         assert "error" in result
         assert "Connection refused" in result["error"]
 
+    @pytest.mark.asyncio()
+    async def test_health_check_cached(self):
+        """Test that health results are reused until invalidated."""
+        client = AIServiceClient("test", "http://localhost:8000")
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"status": "healthy"}
+
+        client.client = AsyncMock()
+        client.client.get.return_value = mock_response
+
+        await client.health_check()
+        await client.health_check()
+        assert client.client.get.call_count == 1
+
+        client.invalidate_health()
+        await client.health_check()
+        assert client.client.get.call_count == 2
+
     @pytest.mark.asyncio()
     async def test_post_request_success(self):
         """Test successful POST request."""
         client = AIServiceClient("test", "http://localhost:8000")
 
         mock_response = Mock()
-        mock_response.json.return_value = {"result": "success"}
+        mock_response.content = b'{"result": "success"}'
         mock_response.raise_for_status = Mock()
 
         client.client = AsyncMock()
@@ -138,7 +158,8 @@ class TestAIServiceClient:
         assert result["result"] == "success"
         client.client.post.assert_called_once_with(
             "http://localhost:8000/endpoint",
-            json={"data": "test"},
+            content=b'{"data":"test"}',
+            headers={"Content-Type": "application/json"},
         )
 
     @pytest.mark.asyncio()
@@ -147,6 +168,7 @@ class TestAIServiceClient:
         client = AIServiceClient("test", "http://localhost:8000")
 
         import httpx
+        from tenacity import wait_none
 
         client.client = AsyncMock()
         client.client.post.side_effect = httpx.HTTPStatusError(
@@ -155,11 +177,60 @@ class TestAIServiceClient:
             response=Mock(status_code=500),
         )
 
-        result = await client.post("endpoint", {"data": "test"})
+        # Server errors are retried; skip the backoff between attempts
+        with patch.object(AIServiceClient._post.retry, "wait", wait_none()):
+            result = await client.post("endpoint", {"data": "test"})
 
         assert result["status"] == "error"
+        assert client.client.post.call_count == 3
         assert "error" in result
 
+    @pytest.mark.asyncio()
+    async def test_post_request_client_error_not_retried(self):
+        """Test that 4xx responses are returned without retrying."""
+        client = AIServiceClient("test", "http://localhost:8000")
+
+        import httpx
+
+        client.client = AsyncMock()
+        client.client.post.side_effect = httpx.HTTPStatusError(
+            "Not Found",
+            request=Mock(),
+            response=Mock(status_code=404),
+        )
+
+        result = await client.post("endpoint", {"data": "test"})
+
+        assert result["status"] == "error"
+        client.client.post.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_post_requests_bounded_by_max_concurrency(self):
+        """Test that concurrent requests never exceed max_concurrency."""
+        import asyncio
+
+        client = AIServiceClient("test", "http://localhost:8000", max_concurrency=2)
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = Mock()
+            response.content = b"{}"
+            return response
+
+        client.client = AsyncMock()
+        client.client.post.side_effect = slow_post
+
+        await asyncio.gather(*(client.post("endpoint", {}) for _ in range(10)))
+
+        assert peak == 2
+
 
 class TestAIServicesIntegration:
     """Test the AIServicesIntegration class."""
@@ -296,7 +367,7 @@ class TestNoteParserAIIntegration:
 
     def test_noteparser_with_ai_enabled(self):
         """Test NoteParser initialization with AI enabled."""
-        with patch("noteparser.core.AIServicesIntegration") as mock_ai:
+        with patch("noteparser.integration.ai_services.AIServicesIntegration") as mock_ai:
             parser = NoteParser(enable_ai=True)
 
         assert parser.enable_ai is True
@@ -312,7 +383,10 @@ class TestNoteParserAIIntegration:
 
     def test_noteparser_ai_import_error(self):
         """Test NoteParser when AI services can't be imported."""
-        with patch("noteparser.core.AIServicesIntegration", side_effect=ImportError("No module")):
+        with patch(
+            "noteparser.integration.ai_services.AIServicesIntegration",
+            side_effect=ImportError("No module"),
+        ):
             parser = NoteParser(enable_ai=True)
 
         assert parser.enable_ai is False
@@ -397,15 +471,21 @@ class TestNoteParserAIIntegration:
 class TestWebAppAIIntegration:
     """Test AI integration in the web application."""
 
+    @pytest.fixture(autouse=True)
+    def _isolated_cwd(self, tmp_path, monkeypatch):
+        """Run from a temporary directory; OrganizationSync writes its default config to the CWD."""
+        monkeypatch.chdir(tmp_path)
+
     def test_create_app_with_ai_enabled(self):
         """Test app creation with AI enabled."""
         from noteparser.web.app import create_app
 
-        with patch("noteparser.web.app.AIServicesIntegration") as mock_ai:
+        with patch("noteparser.integration.ai_services.AIServicesIntegration") as mock_ai:
             app = create_app({"AI_ENABLED": True})
 
         assert app.config["AI_INTEGRATION"] is not None
-        mock_ai.assert_called_once()
+        # Once for the app and once for its parser
+        mock_ai.assert_any_call({"AI_ENABLED": True})
 
     def test_create_app_with_ai_disabled(self):
         """Test app creation with AI disabled."""
@@ -420,7 +500,7 @@ class TestWebAppAIIntegration:
         """Test AI dashboard route when AI is enabled."""
         from noteparser.web.app import create_app
 
-        with patch("noteparser.web.app.AIServicesIntegration"):
+        with patch("noteparser.integration.ai_services.AIServicesIntegration"):
             app = create_app()
 
         with app.test_client() as client:
@@ -443,7 +523,7 @@ class TestWebAppAIIntegration:
         """Test successful AI query via web API."""
         from noteparser.web.app import create_app
 
-        with patch("noteparser.web.app.AIServicesIntegration") as mock_ai_class:
+        with patch("noteparser.integration.ai_services.AIServicesIntegration") as mock_ai_class:
             mock_ai = Mock()
             mock_ai_class.return_value = mock_ai
             app = create_app({"AI_ENABLED": True})
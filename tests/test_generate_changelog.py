@@ -0,0 +1,116 @@
+"""Tests for the changelog generation script."""
+
+import importlib.util
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "generate-changelog.py"
+
+
+@pytest.fixture(scope="module")
+def changelog_module():
+    """Load scripts/generate-changelog.py, whose name is not importable."""
+    spec = importlib.util.spec_from_file_location("generate_changelog", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run a git command in the fixture repository."""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def commit(repo: Path, message: str) -> None:
+    """Create an empty commit."""
+    git(repo, "commit", "--allow-empty", "-m", message)
+
+
+@pytest.fixture()
+def merged_repo(tmp_path):
+    """
+    Repository where a side branch is merged in after v1.0.0:
+
+        root -- fix (v1.0.0) -- after v1 ---.
+            \\                                merge (v2.0.0)
+             side work ----------------------'
+    """
+    git(tmp_path, "init", "-q", "-b", "main")
+    commit(tmp_path, "chore: root")
+    git(tmp_path, "branch", "side")
+    git(tmp_path, "checkout", "-q", "side")
+    commit(tmp_path, "feat(side): side work")
+    git(tmp_path, "checkout", "-q", "main")
+    commit(tmp_path, "fix: bug")
+    git(tmp_path, "tag", "v1.0.0")
+    commit(tmp_path, "feat: after v1")
+    git(tmp_path, "checkout", "-q", "side")
+    git(tmp_path, "merge", "-q", "--no-edit", "main")
+    git(tmp_path, "checkout", "-q", "main")
+    git(tmp_path, "merge", "-q", "--ff-only", "side")
+    git(tmp_path, "tag", "v2.0.0")
+    return tmp_path
+
+
+class TestChangelogGenerator:
+    """Test cases for ChangelogGenerator."""
+
+    def test_commits_by_tag_with_merge(self, changelog_module, merged_repo):
+        """Test that merged commits belong to the release that merged them."""
+        generator = changelog_module.ChangelogGenerator(merged_repo)
+        commits_by_tag = generator.get_commits_by_tag(generator.get_git_tags())
+
+        subjects = {
+            tag: {message for _, message, _, _ in commits}
+            for tag, commits in commits_by_tag.items()
+        }
+        assert subjects["v1.0.0"] == {"chore: root", "fix: bug"}
+        assert subjects["v2.0.0"] == {
+            "feat(side): side work",
+            "feat: after v1",
+            "Merge branch 'main' into side",
+        }
+
+    def test_commits_by_tag_matches_tag_ranges(self, changelog_module, merged_repo):
+        """Test that the single-pass bucketing agrees with previous_tag..tag."""
+        generator = changelog_module.ChangelogGenerator(merged_repo)
+        tags = generator.get_git_tags()
+        commits_by_tag = generator.get_commits_by_tag(tags)
+
+        for i, tag in enumerate(tags):
+            from_tag = tags[i + 1] if i + 1 < len(tags) else None
+            expected = list(generator.iter_commits_between_tags(from_tag, tag))
+            assert sorted(commits_by_tag.get(tag, [])) == sorted(expected)
+
+    def test_tag_names_with_separator_characters(self, changelog_module, merged_repo):
+        """Test that tag names containing '|' are listed intact."""
+        git(merged_repo, "tag", "v9|odd", "v1.0.0")
+
+        generator = changelog_module.ChangelogGenerator(merged_repo)
+
+        assert generator.get_git_tags() == ["v9|odd", "v2.0.0", "v1.0.0"]
+
+    def test_tag_sharing_name_with_branch(self, changelog_module, merged_repo):
+        """Test that a tag shadowed by a same-named branch is listed and ranged by its bare name."""
+        git(merged_repo, "branch", "v2.0.0", "v1.0.0")
+
+        generator = changelog_module.ChangelogGenerator(merged_repo)
+        tags = generator.get_git_tags()
+        commits_by_tag = generator.get_commits_by_tag(tags)
+
+        assert tags == ["v2.0.0", "v1.0.0"]
+        assert {message for _, message, _, _ in commits_by_tag["v2.0.0"]} == {
+            "feat(side): side work",
+            "feat: after v1",
+            "Merge branch 'main' into side",
+        }
@@ -0,0 +1,188 @@
+"""Tests for the gunicorn logger classes."""
+
+import logging
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from gunicorn.config import Config
+from gunicorn.glogging import Logger
+
+from noteparser.web.gunicorn_logging import AccessLogger
+
+DEFAULT_FORMAT = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s" %(D)s'
+
+
+@pytest.fixture()
+def access_log_path(tmp_path):
+    """Path of the access log file written by the logger."""
+    return tmp_path / "access.log"
+
+
+@pytest.fixture()
+def access_logger(access_log_path):
+    """AccessLogger writing its access log to a temporary file."""
+    cfg = Config()
+    cfg.set("accesslog", str(access_log_path))
+    cfg.set("errorlog", "-")
+    log = AccessLogger(cfg)
+
+    uvicorn_access = logging.getLogger("uvicorn.access")
+    saved = uvicorn_access.handlers, uvicorn_access.level, uvicorn_access.propagate
+    yield log
+
+    log.stop_access_log_writer()
+    uvicorn_access.handlers, uvicorn_access.level, uvicorn_access.propagate = saved
+    for handler in log.access_log.handlers:
+        handler.close()
+
+
+def format_access_line(logger_class, access_log_format):
+    """Format one request's access log line the way Logger.access() does."""
+    cfg = Config()
+    cfg.set("accesslog", "-")
+    cfg.set("access_log_format", access_log_format)
+    log = logger_class(cfg)
+    log.now = lambda: "[15/Oct/2026:06:00:00 +0000]"
+
+    req = SimpleNamespace(headers=[("X-FORWARDED-FOR", "10.0.0.1"), ("USER-AGENT", "test")])
+    resp = SimpleNamespace(status="200 OK", sent=42, headers=[("X-Request-Id", "abc")])
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "RAW_URI": "/api/health",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": "127.0.0.1",
+        "HTTP_REFERER": "http://example.com/",
+        "HTTP_USER_AGENT": "test",
+        "FOO": "bar",
+    }
+    atoms = log.atoms(resp, req, environ, timedelta(milliseconds=5))
+    return access_log_format % log.atoms_wrapper_class(atoms)
+
+
+def wait_for_content(path, expected, timeout=5.0):
+    """Poll a file until it holds the expected content or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.read_text() == expected:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+class TestAccessLogAtoms:
+    """Test cases for the lazily expanded access log atoms."""
+
+    def test_default_format_matches_gunicorn(self):
+        """Test that the default format logs the same line as gunicorn's own logger."""
+        assert format_access_line(AccessLogger, DEFAULT_FORMAT) == format_access_line(
+            Logger,
+            DEFAULT_FORMAT,
+        )
+
+    def test_request_header_atom(self):
+        """Test that request header atoms still resolve when the format uses them."""
+        line = format_access_line(AccessLogger, "%(h)s %({x-forwarded-for}i)s")
+
+        assert line == "127.0.0.1 10.0.0.1"
+
+    def test_response_header_atom(self):
+        """Test that response header atoms still resolve when the format uses them."""
+        line = format_access_line(AccessLogger, "%({x-request-id}o)s")
+
+        assert line == "abc"
+
+    def test_environ_atom(self):
+        """Test that environ variable atoms still resolve when the format uses them."""
+        line = format_access_line(AccessLogger, "%({FOO}e)s")
+
+        assert line == "bar"
+
+    def test_unused_atoms_skipped(self):
+        """Test that header and environ atoms aren't built when the format doesn't use them."""
+        cfg = Config()
+        cfg.set("accesslog", "-")
+        cfg.set("access_log_format", DEFAULT_FORMAT)
+        log = AccessLogger(cfg)
+        req = SimpleNamespace(headers=[("X-FORWARDED-FOR", "10.0.0.1")])
+        resp = SimpleNamespace(status="200 OK", sent=0, headers=[("X-Request-Id", "abc")])
+        environ = {"REQUEST_METHOD": "GET", "RAW_URI": "/", "SERVER_PROTOCOL": "HTTP/1.1"}
+
+        atoms = log.atoms(resp, req, environ, timedelta(0))
+
+        assert not [key for key in atoms if key.startswith("{")]
+
+
+class TestAccessLogWriter:
+    """Test cases for the buffered access log writer."""
+
+    def test_writes_are_batched(self, access_logger, access_log_path):
+        """Test that records stay buffered until the writer flushes."""
+        access_logger.start_access_log_writer(flush_interval=60)
+
+        for i in range(3):
+            access_logger.access_log.info(f"request {i}")
+        time.sleep(0.1)
+
+        assert access_log_path.read_text() == ""
+
+    def test_flushes_after_interval(self, access_logger, access_log_path):
+        """Test that buffered records are written once the flush interval passes."""
+        access_logger.start_access_log_writer(flush_interval=0.1)
+
+        access_logger.access_log.info("request")
+
+        assert wait_for_content(access_log_path, "request\n")
+
+    def test_stop_drains_queue(self, access_logger, access_log_path):
+        """Test that stopping the writer writes out every queued record."""
+        access_logger.start_access_log_writer(flush_interval=60)
+
+        for i in range(1000):
+            access_logger.access_log.info(f"request {i}")
+        access_logger.stop_access_log_writer()
+
+        lines = access_log_path.read_text().splitlines()
+        assert lines == [f"request {i}" for i in range(1000)]
+        assert access_logger.access_log_writer is None
+
+    def test_reopen_files_after_rotation(self, access_logger, access_log_path):
+        """Test that reopen_files() moves the writer on to a fresh file."""
+        access_logger.start_access_log_writer(flush_interval=0.1)
+        access_logger.access_log.info("before rotation")
+        assert wait_for_content(access_log_path, "before rotation\n")
+
+        rotated_path = access_log_path.with_suffix(".log.1")
+        access_log_path.rename(rotated_path)
+        access_logger.reopen_files()
+        access_logger.access_log.info("after rotation")
+        access_logger.stop_access_log_writer()
+
+        assert rotated_path.read_text() == "before rotation\n"
+        assert access_log_path.read_text() == "after rotation\n"
+
+    def test_covers_uvicorn_access_logger(self, access_logger, access_log_path):
+        """Test that uvicorn's access logger, sharing gunicorn's handlers, is buffered too."""
+        # UvicornWorker.__init__ points uvicorn.access at the same handler list
+        uvicorn_access = logging.getLogger("uvicorn.access")
+        uvicorn_access.handlers = access_logger.access_log.handlers
+        uvicorn_access.setLevel(logging.INFO)
+        uvicorn_access.propagate = False
+
+        access_logger.start_access_log_writer(flush_interval=60)
+        uvicorn_access.info('%s - "%s"', "127.0.0.1", "GET /")
+        access_logger.stop_access_log_writer()
+
+        assert access_log_path.read_text() == '127.0.0.1 - "GET /"\n'
+        assert not any(isinstance(h, logging.FileHandler) for h in uvicorn_access.handlers)
+
+    def test_without_access_log_file(self):
+        """Test that nothing is started when the access log isn't a file."""
+        cfg = Config()
+        cfg.set("accesslog", "-")
+        log = AccessLogger(cfg)
+
+        log.start_access_log_writer(flush_interval=1)
+
+        assert log.access_log_writer is None
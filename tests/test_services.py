@@ -0,0 +1,135 @@
+"""Tests for the microservice base classes."""
+
+import asyncio
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from services.base import BaseService, ServiceConfig, ServiceOrchestrator
+
+INTERVAL = 0.05
+
+
+class FakeService(BaseService):
+    """Service whose health check only counts calls, optionally taking a while."""
+
+    def __init__(self, name: str, probe_delay: float = 0.0, timeout: int = 30):
+        super().__init__(
+            ServiceConfig(
+                name=name,
+                version="1.0.0",
+                timeout=timeout,
+                health_check_interval=INTERVAL,
+            ),
+        )
+        self.probe_delay = probe_delay
+        self.health_checks = 0
+        self.pending_tasks_at_cleanup = None
+
+    async def initialize(self):
+        pass
+
+    async def cleanup(self):
+        current = asyncio.current_task()
+        self.pending_tasks_at_cleanup = [t for t in asyncio.all_tasks() if t is not current]
+
+    async def process(self, data):
+        return data
+
+    async def health_check(self) -> bool:
+        self.health_checks += 1
+        await asyncio.sleep(self.probe_delay)
+        return True
+
+
+@pytest_asyncio.fixture()
+async def orchestrator():
+    """Orchestrator that is shut down after the test."""
+    orchestrator = ServiceOrchestrator()
+    yield orchestrator
+    await orchestrator.shutdown()
+
+
+class TestServiceOrchestrator:
+    """Test cases for the orchestrator's health check scheduling."""
+
+    @pytest.mark.asyncio()
+    async def test_health_checks_run_on_interval(self, orchestrator):
+        """Test that each service is checked once per interval."""
+        service = FakeService("fast")
+        await orchestrator.register_service(service)
+
+        await asyncio.sleep(INTERVAL * 5.5)
+
+        assert 3 <= service.health_checks <= 6
+        assert service.is_healthy is True
+        assert service.last_health_check is not None
+
+    @pytest.mark.asyncio()
+    async def test_slow_probe_does_not_delay_others(self, orchestrator):
+        """Test that a slow health check doesn't hold up other services' checks."""
+        slow = FakeService("slow", probe_delay=10)
+        fast = FakeService("fast")
+        await orchestrator.register_service(slow)
+        await orchestrator.register_service(fast)
+
+        await asyncio.sleep(INTERVAL * 5.5)
+
+        assert slow.health_checks == 1
+        assert fast.health_checks >= 3
+
+    @pytest.mark.asyncio()
+    async def test_reregistration_does_not_double_checks(self, orchestrator):
+        """Test that re-registering a service keeps a single check schedule."""
+        first = FakeService("svc")
+        second = FakeService("svc")
+        await orchestrator.register_service(first)
+        await orchestrator.register_service(second)
+
+        await asyncio.sleep(INTERVAL * 5.5)
+
+        assert first.health_checks == 0
+        assert 3 <= second.health_checks <= 6
+        assert [name for _, name in orchestrator._health_schedule] == ["svc"]
+
+    @pytest.mark.asyncio()
+    async def test_unregistered_service_leaves_schedule(self, orchestrator):
+        """Test that an unregistered service is no longer checked."""
+        service = FakeService("gone")
+        await orchestrator.register_service(service)
+        await orchestrator.unregister_service("gone")
+
+        await asyncio.sleep(INTERVAL * 3)
+
+        assert service.health_checks == 0
+        assert orchestrator._health_schedule == []
+        assert "gone" not in orchestrator._health_scheduled
+
+    @pytest.mark.asyncio()
+    async def test_shutdown_leaves_no_pending_tasks(self):
+        """Test that shutdown waits for the scheduler and running checks to finish."""
+        orchestrator = ServiceOrchestrator()
+        service = FakeService("slow", probe_delay=10)
+        await orchestrator.register_service(service)
+        await asyncio.sleep(INTERVAL * 2)
+        assert len(orchestrator._health_tasks) == 1
+
+        await orchestrator.shutdown()
+
+        assert service.pending_tasks_at_cleanup == []
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    @pytest.mark.asyncio()
+    async def test_shared_session_requests_use_service_timeout(self, orchestrator):
+        """Test that requests on the shared session keep each service's own timeout."""
+        service = FakeService("svc", timeout=5)
+        await orchestrator.register_service(service)
+        session = orchestrator._get_session()
+
+        with patch.object(session, "request") as request:
+            service._request("GET", "http://localhost:8000/health")
+
+        assert session.timeout.total == ServiceConfig.timeout
+        assert request.call_args.kwargs["timeout"] == aiohttp.ClientTimeout(total=5)